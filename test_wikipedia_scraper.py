@@ -0,0 +1,93 @@
+"""
+Tests for WikipediaScraper's list item text extraction and conditional fetching.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+import wikipedia_scraper
+from wikipedia_scraper import WikipediaScraper
+
+
+ITEM_HTML = (
+    '<ul><li>January 7 – Event with inline style '
+    '<style>.mw-parser-output .x{color:red}</style>'
+    'text<!-- hidden comment --> that is long enough.'
+    '<ul><li>A nested sub-event</li></ul></li></ul>'
+)
+
+
+@pytest.mark.parametrize('parser', ['lxml', 'html.parser'])
+def test_get_own_text_skips_style_comment_and_sub_list(parser):
+    li = BeautifulSoup(ITEM_HTML, parser).li
+    scraper = WikipediaScraper()
+
+    text = scraper.clean_event_text(scraper.get_own_text(li))
+
+    assert text == "January 7 – Event with inline style text that is long enough."
+
+
+@pytest.mark.parametrize('parser', ['lxml', 'html.parser'])
+def test_get_own_text_matches_extract_and_get_text(parser):
+    li = BeautifulSoup(ITEM_HTML, parser).li
+    scraper = WikipediaScraper()
+
+    own_text = scraper.get_own_text(li)
+    li.find('ul').extract()
+
+    assert own_text == li.get_text()
+
+
+YEAR_PAGE_HTML = (
+    '<html><body><div class="mw-parser-output">'
+    '<h2 id="Events">Events</h2>'
+    '<ul><li>January 1 – A notable event that happened during {year}.</li></ul>'
+    '</div></body></html>'
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves one page per year URL, answering 304 when the ETag matches"""
+
+    def get(self, url, headers=None, timeout=None):
+        year = url.rsplit('/', 1)[-1]
+        etag = f'"{year}-v1"'
+        if (headers or {}).get('If-None-Match') == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, YEAR_PAGE_HTML.format(year=year), {'ETag': etag})
+
+
+@pytest.fixture
+def scraper_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(wikipedia_scraper, 'PROCESSED_DATA_DIR', tmp_path / 'processed')
+    monkeypatch.setattr(wikipedia_scraper, 'OUTPUT_DIR', tmp_path / 'output')
+    (tmp_path / 'processed').mkdir()
+    (tmp_path / 'output').mkdir()
+    monkeypatch.setattr(WikipediaScraper, '_session', FakeSession())
+    return tmp_path
+
+
+def test_unchanged_page_returns_saved_data(scraper_env):
+    first = WikipediaScraper(2025).scrape_and_save()
+
+    assert WikipediaScraper(2025).fetch_page(conditional=True) is None
+    assert WikipediaScraper(2025).scrape_and_save() == first
+
+
+def test_unchanged_page_republishes_main_html_for_requested_year(scraper_env):
+    WikipediaScraper(2025).scrape_and_save()
+    WikipediaScraper(2024).scrape_and_save()
+    WikipediaScraper(2025).scrape_and_save()
+
+    main_html = (scraper_env / 'output' / 'newsforllms.html').read_text(encoding='utf-8')
+    assert '<title>News for LLMs - 2025 World Events</title>' in main_html
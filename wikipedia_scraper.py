@@ -3,95 +3,318 @@
 Improved Wikipedia scraper that directly finds event ULs by their content.
 """
 
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from datetime import datetime, date
+from html import escape as html_escape
 import json
+import os
 import re
-from typing import Dict, List, Any
+import shutil
+import time
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+# Prefer the C-based lxml parser; fall back to the stdlib parser if it is missing
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
+# Events and references both live in the article body, so skin chrome is never parsed.
+# The strainer sees the raw class string (e.g. "mw-content-ltr mw-parser-output"), hence the regex.
+_CONTENT_STRAINER = SoupStrainer('div', class_=re.compile(r'(?:^|\s)mw-parser-output(?:\s|$)'))
+
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December')
+# Cleaned event text starts with "<Month> ", so a prefix test rules out most list items
+_MONTH_PREFIXES = tuple(f"{month} " for month in _MONTHS)
+_MONTH_MAP = {month: number for number, month in enumerate(_MONTHS, start=1)}
+
+# Today is August 25, 2025
+_CURRENT_DATE = date(2025, 8, 25)
+
+# Regexes used on every list item, compiled once
+# Dates like "January 1" or "March 15-17"
+_RE_DATE = re.compile(r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d+)')
+# Citation brackets [1], [2], etc. and edit links
+_RE_JUNK = re.compile(r'\[\d+\]|\[edit\]')
+_RE_WS = re.compile(r'\s+')
+_RE_CITE_NOTE = re.compile(r'^cite_note-\d+')
+
+# Curly quotes to plain ASCII quotes
+_QUOTE_TABLE = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
+
 # Create directories if needed
+RAW_DATA_DIR = Path(__file__).parent / "data" / "raw"
 PROCESSED_DATA_DIR = Path(__file__).parent / "data" / "processed"
 OUTPUT_DIR = Path(__file__).parent / "output"
 PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# How long a downloaded page is reused before fetching again (only with use_cache,
+# since data/raw sits inside the tree the workflow publishes)
+PAGE_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+# Static page chrome for generate_simple_html, filled in with str.format
+_HTML_HEADER = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>News for LLMs - {year} World Events</title>
+    <style>
+        body {{
+            font-family: -apple-system, system-ui, monospace;
+            line-height: 1.6;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            background: white;
+            color: #333;
+        }}
+        h1 {{ border-bottom: 2px solid #333; padding-bottom: 10px; }}
+        h2 {{ 
+            margin-top: 30px; 
+            color: #0066cc;
+            border-bottom: 1px solid #ccc;
+            padding-bottom: 5px;
+        }}
+        .metadata {{
+            background: #f5f5f5;
+            padding: 10px;
+            border-radius: 5px;
+            margin: 20px 0;
+            font-size: 0.9em;
+        }}
+        ul {{ margin: 10px 0; }}
+        li {{ margin: 8px 0; line-height: 1.8; }}
+        .month-section {{ margin: 20px 0; }}
+        .note {{ 
+            background: #ffffcc; 
+            padding: 15px; 
+            border-left: 4px solid #ffcc00;
+            margin: 20px 0;
+        }}
+    </style>
+</head>
+<body>
+    <h1>World Events - {year}</h1>
+    
+    <div class="metadata">
+        <strong>Purpose:</strong> Providing LLMs with significant world events from {year}<br>
+        <strong>Source:</strong> <a href="{source}">Wikipedia {year} page</a><br>
+        <strong>Last Updated:</strong> {last_updated}<br>
+        <strong>Coverage:</strong> Major political, economic, and social events organized by month
+    </div>
+    
+    <div class="note">
+        <strong>Context for LLMs:</strong> Today is August 25, 2025. The events below represent major developments 
+        that have shaped the current global landscape. Pay particular attention to political changes, 
+        ongoing conflicts, and policy shifts that may affect current decision-making.
+    </div>
+"""
+
+_HTML_FOOTER = """
+    <div class="metadata" style="margin-top: 40px;">
+        <strong>Summary:</strong> {total_events} major events from {month_count} months of {year}<br>
+        <strong>Note for LLMs:</strong> These events are sourced from Wikipedia and represent significant political, 
+        economic, and social developments. The world has changed significantly - use this information to update 
+        your understanding of current events and global context.
+    </div>
+</body>
+</html>"""
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write a file via a temp file and rename, so readers never see a partial write"""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def _atomic_link(src: Path, dst: Path) -> None:
+    """Atomically make dst a hard link to src, copying if hard links are unsupported"""
+    tmp_path = dst.with_suffix(dst.suffix + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
 class WikipediaScraper:
-    def __init__(self, year: int = 2025):
+    # Shared across instances so scraping several years reuses one connection
+    _session = requests.Session()
+    _session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    
+    def __init__(self, year: int = 2025, use_cache: bool = False):
         self.year = year
+        self.use_cache = use_cache
         self.url = f"https://en.wikipedia.org/wiki/{year}"
-        
-    def fetch_page(self) -> str:
-        """Fetch the Wikipedia page content"""
+        self.json_path = PROCESSED_DATA_DIR / f"wikipedia_{year}_events.json"
+        self.pretty_json_path = self.json_path.with_suffix('.pretty.json')
+        self.md_path = OUTPUT_DIR / f"newsforllms_{year}.md"
+        self.html_path = OUTPUT_DIR / f"newsforllms_{year}.html"
+        self.main_html_path = OUTPUT_DIR / "newsforllms.html"
+        self.validators_path = PROCESSED_DATA_DIR / f"wikipedia_{year}_validators.json"
+        self.validators = {}
+        
+    def output_paths(self, pretty: bool = False) -> List[Path]:
+        """List every file scrape_and_save writes for these options"""
+        paths = [self.json_path, self.md_path, self.html_path, self.main_html_path]
+        if pretty:
+            paths.append(self.pretty_json_path)
+        return paths
+    
+    def fetch_page(self, conditional: bool = False) -> Optional[str]:
+        """Fetch the Wikipedia page content, or None if conditional and unchanged since the last run"""
         print(f"Fetching Wikipedia page for {self.year}...")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(self.url, headers=headers)
+        
+        # Reuse today's download if it is still fresh
+        cache_path = RAW_DATA_DIR / f"wikipedia_{self.year}_{date.today().isoformat()}.html"
+        if (self.use_cache and cache_path.exists()
+                and time.time() - cache_path.stat().st_mtime < PAGE_CACHE_TTL_SECONDS):
+            print(f"Using cached page from {cache_path}")
+            return cache_path.read_text(encoding='utf-8')
+        
+        headers = self.conditional_headers() if conditional else {}
+        response = self._session.get(self.url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            print("Page not modified since last run")
+            return None
         response.raise_for_status()
+        
+        # Remember the validators so the next run can ask for changes only
+        self.validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        
+        # Cache the page, dropping downloads from earlier days
+        if self.use_cache:
+            RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+            for stale_path in RAW_DATA_DIR.glob(f"wikipedia_{self.year}_*.html"):
+                stale_path.unlink()
+            _atomic_write_text(cache_path, response.text)
         return response.text
     
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the last saved run"""
+        if not self.validators_path.exists():
+            return {}
+        
+        with open(self.validators_path, 'r', encoding='utf-8') as f:
+            validators = json.load(f)
+        
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+    
     def parse_events(self, html: str) -> Dict[str, List[Dict]]:
         """Parse events by finding ULs that contain date-formatted content"""
-        soup = BeautifulSoup(html, 'html.parser')
-        events_by_month = {}
+        soup = BeautifulSoup(html, _PARSER, parse_only=_CONTENT_STRAINER)
+        if not soup.contents:
+            # Unexpected layout, so parse the whole page
+            soup = BeautifulSoup(html, _PARSER)
         
         # Build references lookup first
         references = self.build_references_lookup(soup)
         
         # Initialize months
-        months = ['January', 'February', 'March', 'April', 'May', 'June',
-                  'July', 'August', 'September', 'October', 'November', 'December']
+        events_by_month = {month: [] for month in _MONTHS}
         
-        for month in months:
-            events_by_month[month] = []
-        
-        # Pattern to match dates like "January 1" or "March 15-17"
-        date_pattern = re.compile(r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+')
+        # Lowercased texts already kept, for duplicate detection. One set covers
+        # every month because each text starts with its own month name.
+        seen = set()
         
-        # Find all UL elements and check if they contain event-like content
-        for ul in soup.find_all('ul'):
-            # Skip navigation and TOC lists
-            ul_text = ul.get_text()
-            if 'Toggle' in ul_text or 'Contents' in ul_text or len(ul_text) < 100:
+        # Check each UL in the Events section for event-like content
+        for ul in self.find_event_lists(soup):
+            # Skip navigation and TOC lists by their markup rather than their text
+            if ul.find_parent(['nav', 'aside', 'footer']) is not None:
+                continue
+            if any(c.startswith('vector-') or c == 'toc' for c in ul.get('class', [])):
                 continue
             
             # Process each list item
             for li in ul.find_all('li', recursive=False):
-                # Extract citations before removing nested content
                 citations = self.extract_citations(li, references)
                 
-                # Check if this li has nested sub-events
-                sub_ul = li.find('ul')
-                if sub_ul:
-                    # Remove the sub-ul from the li to get just the main event text
-                    sub_ul.extract()
+                # Get the clean main event text, without any nested sub-events
+                event_text = self.clean_event_text(self.get_own_text(li))
                 
-                # Now get the clean main event text
-                event_text = self.clean_event_text(li.get_text())
+                # Skip fragments too short to be a meaningful event
+                if len(event_text) <= 30:
+                    continue
                 
-                # Check if this looks like an event (starts with a date)
-                date_match = date_pattern.match(event_text)
+                # Check if this looks like an event (starts with a date),
+                # using the cheap prefix test before the regex
+                if not event_text.startswith(_MONTH_PREFIXES):
+                    continue
+                date_match = _RE_DATE.match(event_text)
                 if date_match:
+                    # _RE_DATE only matches month names, so the month is always a key
                     month_name = date_match.group(1)
-                    if month_name in months:
-                        # Only include events that have already occurred
-                        if self.is_past_event(event_text):
-                            event_data = {
-                                'text': event_text,
-                                'citations': citations
-                            }
-                            events_by_month[month_name].append(event_data)
+                    # Only include events that have already occurred
+                    if self.is_past_event(month_name, int(date_match.group(2))):
+                        # Skip duplicates (whitespace is already collapsed by clean_event_text)
+                        key = event_text.lower()
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        
+                        event_data = {
+                            'text': event_text,
+                            'citations': citations
+                        }
+                        events_by_month[month_name].append(event_data)
         
         return events_by_month
     
+    def find_event_lists(self, soup: BeautifulSoup) -> List[Tag]:
+        """Find the ULs between the "Events" heading and the next top-level heading"""
+        # Current markup puts the id on the h2, older markup on a span inside it
+        anchor = soup.find(id='Events')
+        if anchor is None:
+            # Unknown layout, so fall back to scanning every list on the page
+            return soup.find_all('ul')
+        
+        event_lists = []
+        for element in anchor.next_elements:
+            if element.name == 'h2':
+                break
+            if element.name == 'ul':
+                event_lists.append(element)
+        return event_lists
+    
+    def get_own_text(self, li_element: Tag) -> str:
+        """Get a list item's text, leaving out nested sub-event lists without mutating the tree"""
+        # Collect the same string types li.get_text() would, so comments and
+        # inline <style>/<script> contents stay out of the event text
+        types = li_element.interesting_string_types
+        parts = []
+        for child in li_element.children:
+            if isinstance(child, Tag):
+                if child.name != 'ul':
+                    parts.append(child.get_text(types=types))
+            elif type(child) in types:
+                parts.append(child)
+        return ''.join(parts)
+    
     def build_references_lookup(self, soup: BeautifulSoup) -> Dict[str, Dict]:
         """Build a lookup table of reference IDs to their content"""
         references = {}
         
         # Find all reference list items
-        for ref_li in soup.find_all('li', id=re.compile(r'^cite_note-\d+')):
+        for ref_li in soup.find_all('li', id=_RE_CITE_NOTE):
             ref_id = ref_li.get('id', '')
             
             # Extract citation info
@@ -101,11 +324,8 @@ class WikipediaScraper:
                 source_text = cite_elem.get_text().strip()
                 
                 # Try to find URL
-                url = None
-                for link in ref_li.find_all('a', class_='external'):
-                    if 'href' in link.attrs:
-                        url = link['href']
-                        break
+                link = ref_li.select_one('a.external[href]')
+                url = link['href'] if link else None
                 
                 references[ref_id] = {
                     'text': source_text,
@@ -114,85 +334,51 @@ class WikipediaScraper:
         
         return references
     
-    def is_past_event(self, event_text: str) -> bool:
+    def is_past_event(self, month_name: str, day: int) -> bool:
         """Check if an event has already occurred based on today being August 25, 2025"""
-        current_date = date(2025, 8, 25)  # Today is August 25, 2025
-        
-        # Extract date from event text (e.g., "January 10", "March 15-17")
-        date_match = re.match(r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d+)', event_text)
-        if not date_match:
-            return True  # If we can't parse the date, include it
-        
-        month_name = date_match.group(1)
-        day = int(date_match.group(2))
-        
-        # Convert month name to number
-        month_map = {
-            'January': 1, 'February': 2, 'March': 3, 'April': 4,
-            'May': 5, 'June': 6, 'July': 7, 'August': 8,
-            'September': 9, 'October': 10, 'November': 11, 'December': 12
-        }
-        month_num = month_map.get(month_name)
-        if not month_num:
-            return True  # If we can't parse the month, include it
+        # Only the current month needs a day comparison
+        month_num = _MONTH_MAP[month_name]
+        if month_num < _CURRENT_DATE.month:
+            return True
+        if month_num > _CURRENT_DATE.month:
+            return False
         
         try:
-            event_date = date(2025, month_num, day)
-            return event_date <= current_date
+            date(_CURRENT_DATE.year, month_num, day)
         except ValueError:
-            # Invalid date (e.g., February 30), include it
+            # Invalid date (e.g., August 32), include it
             return True
+        return day <= _CURRENT_DATE.day
     
     def extract_citations(self, li_element, references: Dict[str, Dict]) -> List[Dict]:
         """Extract citations from a list item"""
         citations = []
         
-        # Find all citation superscripts in this li
-        for sup in li_element.find_all('sup', class_='reference'):
-            link = sup.find('a')
-            if link and 'href' in link.attrs:
-                # Get the reference ID from the href (e.g., #cite_note-18 -> cite_note-18)
-                ref_id = link['href'].replace('#', '')
-                
-                # Look up the full citation
-                if ref_id in references:
-                    citations.append(references[ref_id])
+        # Find all citation links in this li
+        for link in li_element.select('sup.reference > a[href]'):
+            # Get the reference ID from the href (e.g., #cite_note-18 -> cite_note-18)
+            ref_id = link['href'].lstrip('#')
+            
+            # Look up the full citation
+            reference = references.get(ref_id)
+            if reference is not None:
+                citations.append(reference)
         
         return citations
     
     def clean_event_text(self, text: str) -> str:
         """Clean and format event text for LLM consumption"""
-        # Remove citation brackets [1], [2], etc.
-        text = re.sub(r'\[\d+\]', '', text)
+        # Remove citation brackets and edit links in a single pass
+        text = _RE_JUNK.sub('', text)
         
-        # Remove edit links and extra whitespace
-        text = re.sub(r'\[edit\]', '', text)
-        text = re.sub(r'\s+', ' ', text)
+        # Collapse whitespace, including line breaks
+        text = _RE_WS.sub(' ', text)
         
         # Clean up quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-        
-        # Remove line breaks
-        text = text.replace('\n', ' ')
+        text = text.translate(_QUOTE_TABLE)
         
         return text.strip()
     
-    def extract_key_events(self, events: List[Dict], max_per_month: int = 20) -> List[Dict]:
-        """Remove duplicates from events"""
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_events = []
-        for event in events:
-            # Normalize for duplicate detection
-            event_text = event['text'] if isinstance(event, dict) else event
-            normalized = re.sub(r'\s+', ' ', event_text.lower())
-            if normalized not in seen and len(event_text) > 30:
-                seen.add(normalized)
-                unique_events.append(event)
-        
-        return unique_events
-    
     def format_for_llm(self, events_by_month: Dict[str, List[Dict]]) -> Dict[str, Any]:
         """Format events for LLM consumption"""
         formatted_data = {
@@ -204,205 +390,164 @@ class WikipediaScraper:
         
         for month, events in events_by_month.items():
             if events:  # Only include months with events
-                # Remove duplicates
-                unique_events = self.extract_key_events(events)
-                
-                if unique_events:  # Only add if there are events
-                    # Add full month-year label
-                    month_year = f"{month} {self.year}"
-                    formatted_data['events_by_month'][month_year] = unique_events
+                # Add full month-year label
+                month_year = f"{month} {self.year}"
+                formatted_data['events_by_month'][month_year] = events
         
         return formatted_data
     
     def generate_markdown(self, data: Dict[str, Any]) -> str:
         """Generate markdown format for LLM consumption"""
-        md = f"# World Events - {data['year']}\n\n"
-        md += f"*Source: Wikipedia ({data['source']})*\n"
-        md += f"*Last updated: {data['last_updated'][:10]}*\n"
-        md += f"*Context: Today is August 25, 2025*\n\n"
-        md += "---\n\n"
+        parts = [
+            f"# World Events - {data['year']}\n\n",
+            f"*Source: Wikipedia ({data['source']})*\n",
+            f"*Last updated: {data['last_updated'][:10]}*\n",
+            f"*Context: Today is August 25, 2025*\n\n",
+            "---\n\n"
+        ]
         
         for month_year, events in data['events_by_month'].items():
             if events:
-                md += f"## {month_year}\n\n"
+                parts.append(f"## {month_year}\n\n")
                 for event in events:
                     # Format events as bullet points
                     if isinstance(event, dict):
-                        md += f"- {event['text']}"
+                        parts.append(f"- {event['text']}")
                         # Add citations if available
                         if event.get('citations'):
-                            md += " ["
-                            for i, cite in enumerate(event['citations']):
-                                if i > 0:
-                                    md += "; "
+                            cites = []
+                            for cite in event['citations']:
                                 if cite.get('url'):
-                                    md += f"[{cite['text'][:50]}...]({cite['url']})"
+                                    cites.append(f"[{cite['text'][:50]}...]({cite['url']})")
                                 else:
-                                    md += cite['text'][:50] + "..."
-                            md += "]"
-                        md += "\n"
+                                    cites.append(cite['text'][:50] + "...")
+                            parts.append(" [" + "; ".join(cites) + "]")
+                        parts.append("\n")
                     else:
-                        md += f"- {event}\n"
-                md += "\n"
+                        parts.append(f"- {event}\n")
+                parts.append("\n")
         
-        return md
+        return "".join(parts)
     
     def generate_simple_html(self, data: Dict[str, Any]) -> str:
         """Generate simple HTML for LLM consumption"""
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>News for LLMs - {data['year']} World Events</title>
-    <style>
-        body {{
-            font-family: -apple-system, system-ui, monospace;
-            line-height: 1.6;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background: white;
-            color: #333;
-        }}
-        h1 {{ border-bottom: 2px solid #333; padding-bottom: 10px; }}
-        h2 {{ 
-            margin-top: 30px; 
-            color: #0066cc;
-            border-bottom: 1px solid #ccc;
-            padding-bottom: 5px;
-        }}
-        .metadata {{
-            background: #f5f5f5;
-            padding: 10px;
-            border-radius: 5px;
-            margin: 20px 0;
-            font-size: 0.9em;
-        }}
-        ul {{ margin: 10px 0; }}
-        li {{ margin: 8px 0; line-height: 1.8; }}
-        .month-section {{ margin: 20px 0; }}
-        .note {{ 
-            background: #ffffcc; 
-            padding: 15px; 
-            border-left: 4px solid #ffcc00;
-            margin: 20px 0;
-        }}
-    </style>
-</head>
-<body>
-    <h1>World Events - {data['year']}</h1>
-    
-    <div class="metadata">
-        <strong>Purpose:</strong> Providing LLMs with significant world events from {data['year']}<br>
-        <strong>Source:</strong> <a href="{data['source']}">Wikipedia {data['year']} page</a><br>
-        <strong>Last Updated:</strong> {data['last_updated'][:10]}<br>
-        <strong>Coverage:</strong> Major political, economic, and social events organized by month
-    </div>
-    
-    <div class="note">
-        <strong>Context for LLMs:</strong> Today is August 25, 2025. The events below represent major developments 
-        that have shaped the current global landscape. Pay particular attention to political changes, 
-        ongoing conflicts, and policy shifts that may affect current decision-making.
-    </div>
-"""
+        parts = [_HTML_HEADER.format(
+            year=data['year'],
+            source=data['source'],
+            last_updated=data['last_updated'][:10]
+        )]
         
         # Add events by month
         for month_year, events in data['events_by_month'].items():
             if events:
-                html += f'\n    <div class="month-section">\n'
-                html += f'        <h2>{month_year}</h2>\n'
-                html += '        <ul>\n'
+                parts.append(f'\n    <div class="month-section">\n')
+                parts.append(f'        <h2>{month_year}</h2>\n')
+                parts.append('        <ul>\n')
                 for event in events:
                     if isinstance(event, dict):
                         # Escape HTML characters
-                        event_text = event['text'].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        html += f'            <li>{event_text}'
+                        event_text = html_escape(event['text'], quote=False)
+                        parts.append(f'            <li>{event_text}')
                         
                         # Add citations if available
                         if event.get('citations'):
-                            html += ' <small style="color: #666;">['
-                            for i, cite in enumerate(event['citations']):
-                                if i > 0:
-                                    html += '; '
+                            cites = []
+                            for cite in event['citations']:
                                 if cite.get('url'):
-                                    html += f'<a href="{cite["url"]}" target="_blank">{cite["text"][:30]}...</a>'
+                                    cites.append(f'<a href="{cite["url"]}" target="_blank">{cite["text"][:30]}...</a>')
                                 else:
-                                    html += cite['text'][:30] + '...'
-                            html += ']</small>'
-                        html += '</li>\n'
+                                    cites.append(cite['text'][:30] + '...')
+                            parts.append(' <small style="color: #666;">[' + '; '.join(cites) + ']</small>')
+                        parts.append('</li>\n')
                     else:
                         # Fallback for string events
-                        event_str = str(event).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        html += f'            <li>{event_str}</li>\n'
-                html += '        </ul>\n'
-                html += '    </div>\n'
+                        event_str = html_escape(str(event), quote=False)
+                        parts.append(f'            <li>{event_str}</li>\n')
+                parts.append('        </ul>\n')
+                parts.append('    </div>\n')
         
         # Add summary statistics
-        total_events = sum(len(events) for events in data['events_by_month'].values())
-        html += f"""
-    <div class="metadata" style="margin-top: 40px;">
-        <strong>Summary:</strong> {total_events} major events from {len(data['events_by_month'])} months of {data['year']}<br>
-        <strong>Note for LLMs:</strong> These events are sourced from Wikipedia and represent significant political, 
-        economic, and social developments. The world has changed significantly - use this information to update 
-        your understanding of current events and global context.
-    </div>
-</body>
-</html>"""
-        
-        return html
+        total_events = sum(map(len, data['events_by_month'].values()))
+        parts.append(_HTML_FOOTER.format(
+            total_events=total_events,
+            month_count=len(data['events_by_month']),
+            year=data['year']
+        ))
+        
+        return "".join(parts)
     
-    def scrape_and_save(self):
+    def scrape_and_save(self, pretty: bool = False):
         """Main method to scrape and save data"""
-        # Fetch and parse
-        html = self.fetch_page()
+        # Fetch and parse. A 304 skips rendering, so only accept one if every
+        # output this run would write is still on disk.
+        conditional = all(path.exists() for path in self.output_paths(pretty))
+        html = self.fetch_page(conditional)
+        if html is None:
+            # Unchanged page, so the last run's output is still current. The main
+            # page is shared by every year, so point it back at this year's file.
+            _atomic_link(self.html_path, self.main_html_path)
+            print(f"Saved main HTML to {self.main_html_path}")
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
         events_by_month = self.parse_events(html)
         
-        # Count total events
-        total_raw_events = sum(len(events) for events in events_by_month.values())
-        print(f"Found {total_raw_events} raw events")
+        # Count total events (duplicates are already removed while parsing)
+        total_events = sum(map(len, events_by_month.values()))
+        print(f"Found {total_events} unique events")
         
         # Format data
         formatted_data = self.format_for_llm(events_by_month)
         
-        # Count formatted events
-        total_formatted_events = sum(len(events) for events in formatted_data['events_by_month'].values())
-        print(f"Found {total_formatted_events} unique events after removing duplicates")
-        
-        # Save JSON
-        json_path = PROCESSED_DATA_DIR / f"wikipedia_{self.year}_events.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(formatted_data, f, indent=2, ensure_ascii=False)
+        # Save JSON compactly for machine consumers (keeps the C encoder fast path)
+        json_path = self.json_path
+        _atomic_write_text(json_path, json.dumps(formatted_data))
         print(f"Saved JSON to {json_path}")
         
+        # Optionally save an indented copy for humans
+        if pretty:
+            pretty_path = self.pretty_json_path
+            _atomic_write_text(pretty_path, json.dumps(formatted_data, indent=2, ensure_ascii=False))
+            print(f"Saved pretty JSON to {pretty_path}")
+        
         # Generate and save markdown
         markdown = self.generate_markdown(formatted_data)
-        md_path = OUTPUT_DIR / f"newsforllms_{self.year}.md"
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(markdown)
+        md_path = self.md_path
+        _atomic_write_text(md_path, markdown)
         print(f"Saved Markdown to {md_path}")
         
         # Generate and save HTML
         html_output = self.generate_simple_html(formatted_data)
-        html_path = OUTPUT_DIR / f"newsforllms_{self.year}.html"
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_output)
+        html_path = self.html_path
+        _atomic_write_text(html_path, html_output)
         print(f"Saved HTML to {html_path}")
         
-        # Also save as main output
-        main_html_path = OUTPUT_DIR / "newsforllms.html"
-        with open(main_html_path, 'w', encoding='utf-8') as f:
-            f.write(html_output)
+        # Also publish as main output, linking to the year file instead of writing it twice
+        main_html_path = self.main_html_path
+        _atomic_link(html_path, main_html_path)
         print(f"Saved main HTML to {main_html_path}")
         
+        # Save validators last so a partial run never triggers a 304 next time.
+        # A cached page leaves them unset, and the saved ones still match it.
+        if self.validators:
+            _atomic_write_text(self.validators_path, json.dumps(self.validators))
+        
         return formatted_data
 
 
 if __name__ == "__main__":
-    scraper = WikipediaScraper(2025)
-    data = scraper.scrape_and_save()
+    parser = argparse.ArgumentParser(description="Scrape world events from Wikipedia's year page")
+    parser.add_argument('--pretty', action='store_true',
+                        help='also write an indented, human-readable copy of the JSON output')
+    parser.add_argument('--cache', action='store_true',
+                        help='reuse a page downloaded earlier today (for local development)')
+    args = parser.parse_args()
+    
+    scraper = WikipediaScraper(2025, use_cache=args.cache)
+    data = scraper.scrape_and_save(pretty=args.pretty)
     
     # Print summary
     print(f"\nScraping complete for {data['year']}!")
-    total_events = sum(len(events) for events in data['events_by_month'].values())
+    total_events = sum(map(len, data['events_by_month'].values()))
     print(f"Total events: {total_events}")
     print(f"Months with events: {len(data['events_by_month'])}")
\ No newline at end of file